@@ -4,8 +4,13 @@
 import tkinter
 from tkinter import ttk, simpledialog
 import math
+import time
+import functools
 from datetime import datetime
-import os
+from pathlib import Path
+import atexit
+import threading
+import queue
 
 # This is a 'try-except' block. It's a way to handle potential errors gracefully.
 try:
@@ -26,7 +31,6 @@ except ImportError:
 PINK = "#e2979c"
 RED = "#e7305b"
 GREEN = "#9bdeac"
-YELLOW = "#f7f5dd"
 FONT_NAME = "Courier"
 
 # Timer settings in minutes.
@@ -34,20 +38,141 @@ WORK_MIN = 25
 SHORT_BREAK_MIN = 5
 LONG_BREAK_MIN = 15
 
+# The ringtone is looked up once, next to this script. If it's missing, we store 'None'
+# and the timer uses the system bell instead, without checking the disk again every session.
+_sound_candidate = Path(__file__).with_name('ring.wav')
+_SOUND_PATH = str(_sound_candidate) if _sound_candidate.exists() else None
+
+# Session types. Using numbers instead of reading the title text back from the label
+# means renaming a title (e.g., "Work: {task}") can't break the checkmark logic.
+SESSION_WORK, SESSION_SHORT, SESSION_LONG = 0, 1, 2
+
+# Title color for each session type, in the same order as the numbers above
+# (e.g., 'TITLE_FG[SESSION_SHORT]' is PINK).
+TITLE_FG = (GREEN, PINK, RED)
+
 # --- GLOBAL VARIABLES --- #
 # These variables are defined outside of any function, making them 'global'.
 # They can be accessed and modified by any function in the script, but you must use
 # the 'global' keyword inside a function to modify them.
 
 pomodoros_completed = 0
-timer = None
+timer_active = False # True while a session is counting down. The tick loop always runs, but only counts when this is True.
 rectangle_id = None # Stores the unique ID for the canvas rectangle, so we can modify it later.
-timer_text_id = None # Stores the unique ID for the canvas text, so we can update the time.
+timer_text_id = None # Stores the unique ID for the canvas item holding the timer label, so we can move it.
 current_task = None # Stores the description of the current task.
+current_session_type = None # One of the SESSION_* constants for the running session.
+_current_title_fg = GREEN # The title color currently applied to "Title.TLabel" (set up in the style section below).
+_current_title_text = "Timer" # The text currently shown by 'title_label' (set up in the widget section below).
+end_time = 0.0 # The 'time.monotonic()' value at which the current session ends.
+last_secs = None # The last whole number of seconds shown on screen, so we only redraw when it changes.
+_date_cache = {} # Remembers today's log filename, keyed by the date's ordinal (day number).
+_resize_job = None # The pending 'after' job that will apply the latest canvas size.
+_log_queue = queue.Queue() # Log lines waiting to be written by the background log writer.
+
+# --- TASK LOG FILE --- #
+def _discard_log_file(log_file):
+    """Closes a log file after a failed write, ignoring further errors, and returns None."""
+    if log_file:
+        try:
+            log_file.close()
+        except OSError:
+            pass
+    return None
+
+def _log_worker():
+    """Writes queued (filename, line) pairs to disk on a background thread."""
+    log_file = None  # The open task-log file, kept open between pomodoros.
+    log_name = None  # The filename 'log_file' was opened for, so we can switch files when the day changes.
+    while True:
+        # 'get()' waits until something is put on the queue.
+        batch = [_log_queue.get()]
+        # Grab everything else that is already waiting, so it can all be written in one go.
+        while True:
+            try:
+                batch.append(_log_queue.get_nowait())
+            except queue.Empty:
+                break
+        for item in batch:
+            # 'None' is the signal (sent by '_close_log') that the program is shutting down.
+            if item is None:
+                _discard_log_file(log_file)
+                return
+            filename, line = item
+            # A failed write (no permission, full disk, ...) must not stop this thread,
+            # or every later pomodoro would be queued and silently never written.
+            try:
+                if filename != log_name:
+                    # A new day means a new file, so close (and flush) yesterday's one first.
+                    if log_file:
+                        log_file.close()
+                    log_file = open(filename, "a")
+                    log_name = filename
+                log_file.write(line)
+            except OSError as e:
+                print(f"Warning: could not write to task log '{filename}': {e}.")
+                # Drop the file so the next entry tries to open it again.
+                log_file, log_name = _discard_log_file(log_file), None
+        # Push the whole batch to disk at once.
+        if log_file:
+            try:
+                log_file.flush()
+            except OSError as e:
+                print(f"Warning: could not write to task log '{log_name}': {e}.")
+                log_file, log_name = _discard_log_file(log_file), None
+
+# The writer thread runs for the whole life of the program.
+_log_thread = threading.Thread(target=_log_worker, daemon=True)
+_log_thread.start()
+
+def _close_log():
+    """Lets the log writer finish the queued lines and close its file when the program exits."""
+    _log_queue.put(None)
+    _log_thread.join(timeout=2)
+
+# 'atexit.register' asks Python to call '_close_log' automatically when the script ends.
+atexit.register(_close_log)
+
+# --- SOUND PLAYBACK --- #
+def _play_sound(sound_file):
+    """Plays 'sound_file' on a background thread so the window keeps updating meanwhile."""
+    def worker():
+        # Errors here happen on the background thread, so we can only report them.
+        try:
+            playsound(sound_file)
+        except Exception as e:
+            print(f"Error playing sound: {e}.")
+    # 'daemon=True' means the thread won't keep the program alive after the window closes.
+    threading.Thread(target=worker, daemon=True).start()
+
+# --- TITLE TEXT AND COLOR --- #
+def _set_title_text(text):
+    """Changes the title text, skipping the label update if it already shows that text."""
+    global _current_title_text
+    if text != _current_title_text:
+        title_label.config(text=text)
+        _current_title_text = text
+
+def _set_title_fg(color):
+    """Changes the title color, skipping the style update if it already has that color."""
+    global _current_title_fg
+    # 'style.configure' makes ttk redraw every label using the style, so only call it on a real change.
+    if color != _current_title_fg:
+        style.configure("Title.TLabel", foreground=color)
+        _current_title_fg = color
 
 # --- TIMER ACTIONS --- #
 # These functions are "event handlers" that run when you click the corresponding buttons.
 
+def start_session(duration_min, title, kind):
+    """Starts a session of 'duration_min' minutes with the given title and session type."""
+    global current_session_type
+    reset_timer(silent=True)  # Stop any existing timer without resetting the checkmarks.
+    _set_title_text(title)  # Update the title to show the session.
+    _set_title_fg(TITLE_FG[kind])  # Change the title color for this session type.
+    current_session_type = kind  # Remember which kind of session is running.
+    count_down(duration_min * 60)  # Start the countdown (converted from minutes to seconds).
+
 def start_work():
     """Starts a work session timer."""
     reset_timer(silent=True)  # Stop any existing timer without resetting the checkmarks.
@@ -58,23 +183,12 @@ def start_work():
     # Only start the timer if the user entered a task.
     if task:
         current_task = task
-        title_label.config(text=f"Work: {current_task}")  # Update the title to show the current task.
-        style.configure("Title.TLabel", foreground=GREEN)  # Change the title color to green.
-        count_down(WORK_MIN * 60)  # Start the countdown with the work duration (in seconds).
-
-def start_short_break():
-    """Starts a short break timer."""
-    reset_timer(silent=True)  # Stop any existing timer.
-    title_label.config(text="Break")  # Change the title label to "Break".
-    style.configure("Title.TLabel", foreground=PINK)  # Change the title color to pink.
-    count_down(SHORT_BREAK_MIN * 60)  # Start the countdown with the short break duration.
-
-def start_long_break():
-    """Starts a long break timer."""
-    reset_timer(silent=True)  # Stop any existing timer.
-    title_label.config(text="Break")  # Change the title label to "Break".
-    style.configure("Title.TLabel", foreground=RED)  # Change the title color to red.
-    count_down(LONG_BREAK_MIN * 60)  # Start the countdown with the long break duration.
+        start_session(WORK_MIN, f"Work: {current_task}", SESSION_WORK)
+
+# The break buttons need no extra questions, so they are just 'start_session' with the
+# arguments filled in. 'functools.partial' creates a new function with some arguments preset.
+start_short_break = functools.partial(start_session, SHORT_BREAK_MIN, "Break", SESSION_SHORT)
+start_long_break = functools.partial(start_session, LONG_BREAK_MIN, "Break", SESSION_LONG)
 
 def reset_timer(silent=False):
     """
@@ -82,84 +196,130 @@ def reset_timer(silent=False):
     The 'silent=True' mode is used internally to stop an old timer before starting a new one.
     """
     # The 'global' keyword tells Python that we want to modify the global variables
-    # 'timer' and 'pomodoros_completed', not create new local ones.
-    global timer
+    # 'timer_active' and 'pomodoros_completed', not create new local ones.
+    global timer_active
     global pomodoros_completed
+    global current_session_type
 
-    # 'timer' holds the ID of the scheduled 'after' job.
-    if timer:
-        # 'window.after_cancel()' stops the scheduled countdown loop.
-        window.after_cancel(timer)
-        timer = None
+    # Tell the tick loop to stop counting. The loop itself keeps running, so there is
+    # no scheduled job to cancel.
+    timer_active = False
 
     # This block only runs for a full reset (when the user clicks the "Reset" button).
     if not silent:
-        # 'canvas.itemconfig' changes the properties of an item on the canvas.
-        canvas.itemconfig(timer_text_id, text="00:00")  # Reset the timer text.
-        title_label.config(text="Timer")  # Reset the title text.
-        style.configure("Title.TLabel", foreground=GREEN)  # Reset the title color.
-        check_marks.config(text="")  # Clear all checkmarks.
+        time_var.set("00:00")  # Reset the timer text.
+        _set_title_text("Timer")  # Reset the title text.
+        _set_title_fg(GREEN)  # Reset the title color.
+        if check_var.get():
+            check_var.set("")  # Clear all checkmarks (only if there are any to clear).
         pomodoros_completed = 0  # Reset the completed pomodoros counter.
+        current_session_type = None  # No session is selected after a full reset.
 
 # --- COUNTDOWN MECHANISM --- #
+# '@functools.lru_cache' is a "decorator" that remembers the answer for each 'count' it has seen.
+# The result only depends on 'count', so after the first session every call is a quick lookup.
+@functools.lru_cache(maxsize=2048)
+def format_time(count):
+    """Turns a number of seconds into the "M:SS" text shown on the timer (e.g., 155 -> "2:35")."""
+    # 'divmod' does whole-number division and remainder in one step
+    # (e.g., divmod(155, 60) gives (2, 35): 2 minutes and 35 seconds).
+    count_min, count_sec = divmod(count, 60)
+    # ':02d' pads the seconds to two digits (e.g., "09" instead of "9").
+    return f"{count_min}:{count_sec:02d}"
+
 def count_down(count):
-    """Handles the timer countdown logic and updates the display every second."""
-    # We need to modify the global 'timer' and 'pomodoros_completed' variables.
-    global timer
+    """Starts a countdown of 'count' seconds measured against the monotonic clock."""
+    global end_time, last_secs, timer_active
+    # Instead of subtracting 1 every time 'after(1000)' fires (which slowly drifts when the
+    # event loop is busy), we remember the moment the session ends and measure against it.
+    # 'time.monotonic()' is a clock that never jumps backwards, even if the system time changes.
+    end_time = time.monotonic() + count
+    # Show the full session length straight away; the tick loop takes over from here.
+    last_secs = count
+    time_var.set(format_time(count))
+    timer_active = True
+
+def tick(_monotonic=time.monotonic, _ceil=math.ceil, _floor=math.floor, _format=format_time):
+    """The timer's main loop: runs for the whole life of the app and counts down while a session is active."""
+    # The default arguments above are filled in once, when Python first reads this 'def'.
+    # Inside the function they are local names, which Python finds faster than global ones
+    # (module-level names like 'math' and 'time' need a dictionary lookup on every use).
+    # We need to modify the global 'timer_active' and 'last_secs' variables.
+    global timer_active
+    global last_secs
+
+    # When no session is running, just check again in a quarter of a second.
+    delay = 250
+
+    # 'try/finally' makes sure the next tick is always scheduled, even if something in
+    # 'finish_session()' (logging, sound, ...) raises an error. Otherwise the loop
+    # would stop and the timer would stay frozen until the app is restarted.
+    try:
+        if timer_active:
+            # How many seconds are left? 'max' stops it from going below zero.
+            remaining = max(0, end_time - _monotonic())
+            # 'ceil' rounds up (e.g., 1499.3 -> 1500), so a fresh session starts by showing its full length.
+            secs = _ceil(remaining)
+
+            # Only update the label when the number on screen actually changes.
+            if secs != last_secs:
+                last_secs = secs
+                # Update the timer label by setting its 'StringVar'; Tk redraws the label for us.
+                time_var.set(_format(secs))
+
+            if secs > 0:
+                # Sleep only until the next whole second is reached (plus 5ms of safety margin),
+                # so we wake up once per second, right when the display needs to change.
+                delay = int((remaining - _floor(remaining)) * 1000) + 5
+            else:
+                timer_active = False
+                finish_session()
+    finally:
+        # 'window.after()' tells tkinter to call a function after a specified time (in milliseconds).
+        # There is only ever one of these waiting, so starting or resetting never has to cancel it.
+        window.after(delay, tick)
+
+def finish_session():
+    """Plays the sound, updates the checkmarks and logs the task when a session ends."""
     global current_task
     global pomodoros_completed
-    
-    # 'math.floor' gives the whole number part of a division (e.g., 155 / 60 = 2.58 -> 2).
-    count_min = math.floor(count / 60)  # Calculate remaining minutes.
-    # The modulo operator '%' gives the remainder of a division (e.g., 155 % 60 = 35).
-    count_sec = count % 60  # Calculate remaining seconds.
-    
-    # This ensures the seconds are always two digits (e.g., "09" instead of "9").
-    if count_sec < 10:
-        count_sec = f"0{count_sec}"
-
-    # Update the text on the canvas to show the new time.
-    # f-strings (formatted strings) are an easy way to embed variables in text.
-    canvas.itemconfig(timer_text_id, text=f"{count_min}:{count_sec}")
-    
-    # This is the main loop of the timer.
-    if count > 0:
-        # 'window.after()' tells tkinter to call a function after a specified time (in milliseconds).
-        # Here, it calls 'count_down' again after 1000ms (1 second) with the count reduced by 1.
-        # We store the job ID in 'timer' so we can cancel it later if needed.
-        timer = window.after(1000, count_down, count - 1)
-    else:
-        # When the count reaches 0, the timer is done.
-        # --- Sound Notification with Fallback ---
-        # This try/except block prevents the app from crashing if the sound file is missing or there's an audio error.
-        sound_file = 'ring.wav'
-        try:
-            if os.path.exists(sound_file):
-                playsound(sound_file)
-            else:
-                print(f"Warning: Sound file '{sound_file}' not found. Using system bell.")
-                window.bell() # Use a simple system beep as a fallback.
-        except Exception as e:
-            print(f"Error playing sound: {e}. Using system bell as a fallback.")
+
+    # --- Sound Notification with Fallback ---
+    # This try/except block prevents the app from crashing if the sound file is missing or there's an audio error.
+    try:
+        if _SOUND_PATH is not None:
+            # 'playsound' waits until the sound has finished, which would freeze the window,
+            # so it is handed off to a background thread instead.
+            _play_sound(_SOUND_PATH)
+        else:
+            print("Warning: Sound file 'ring.wav' not found. Using system bell.")
             window.bell() # Use a simple system beep as a fallback.
-        # Check if the session that just ended was a "Work" session by checking the title.
-        if title_label.cget("text").startswith("Work"):
-            pomodoros_completed += 1  # Increment the counter.
-            # Update the checkmarks label to show the new total.
-            # In Python, multiplying a string repeats it (e.g., "A" * 3 is "AAA").
-            check_marks.config(text="✔" * pomodoros_completed)
-
-            # --- LOG THE COMPLETED TASK TO A FILE ---
-            if current_task:
-                # Get the current date to use in the filename.
-                today_str = datetime.now().strftime("%Y-%m-%d")
-                filename = f"{today_str}_Completed-Pomodoro-Tasks.txt"
-                # Get a full timestamp for the log entry.
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                # Open the file in "append" mode ('a') and write the new log entry.
-                with open(filename, "a") as file:
-                    file.write(f"[{timestamp}] Completed: {current_task}\n")
-                current_task = None # Clear the task after it has been logged.
+    except Exception as e:
+        print(f"Error playing sound: {e}. Using system bell as a fallback.")
+        window.bell() # Use a simple system beep as a fallback.
+    # Check if the session that just ended was a "Work" session.
+    if current_session_type == SESSION_WORK:
+        pomodoros_completed += 1  # Increment the counter.
+        # Add one more checkmark to the label. Adding ("+") strings joins them together.
+        check_var.set(check_var.get() + "✔")
+
+        # --- LOG THE COMPLETED TASK TO A FILE ---
+        if current_task:
+            # Get the current date to use in the filename.
+            now = datetime.now()
+            # 'toordinal()' turns the date into a simple day number, which is cheap to compare.
+            ordinal = now.toordinal()
+            filename = _date_cache.get(ordinal)
+            # Only build the filename the first time we log something on a new day.
+            if filename is None:
+                filename = f"{now.strftime('%Y-%m-%d')}_Completed-Pomodoro-Tasks.txt"
+                _date_cache.clear()  # Forget yesterday's filename.
+                _date_cache[ordinal] = filename
+            # Get a full timestamp for the log entry.
+            timestamp = now.strftime("%Y-%m-%d %H:%M:%S")
+            # Hand the new log entry to the background writer, so the window never waits for the disk.
+            _log_queue.put((filename, f"[{timestamp}] Completed: {current_task}\n"))
+            current_task = None # Clear the task after it has been logged.
 
 # --- UI SETUP --- #
 # This section creates the main window and all the visual elements (widgets).
@@ -181,11 +341,22 @@ for i in range(4):
     window.grid_columnconfigure(i, weight=1)
 
 def on_canvas_resize(event):
-    """Resizes the red rectangle and repositions the timer text when the canvas changes size."""
+    """Schedules a resize of the canvas items, collapsing a burst of resize events into one."""
     # This function is an event handler bound to the canvas's resize event.
-    global rectangle_id, timer_text_id
+    # While the user drags the window edge, Tk fires this many times per second, so instead of
+    # redrawing each time we cancel the previous pending redraw and schedule a new one 30ms out.
+    # Only the last event of a drag actually moves anything.
+    global _resize_job
     new_width = event.width  # Get the new width of the canvas from the event object.
     new_height = event.height  # Get the new height.
+    if _resize_job:
+        window.after_cancel(_resize_job)
+    _resize_job = window.after(30, apply_canvas_resize, new_width, new_height)
+
+def apply_canvas_resize(new_width, new_height):
+    """Resizes the red rectangle and repositions the timer text to the given canvas size."""
+    global _resize_job
+    _resize_job = None  # The scheduled job is running now, so there is nothing left to cancel.
     # 'canvas.coords' updates the coordinates of a canvas item.
     # Update the rectangle to fill the new canvas size.
     canvas.coords(rectangle_id, 0, 0, new_width, new_height)
@@ -203,6 +374,12 @@ style.configure("Title.TLabel",
                 foreground=GREEN,  # Set the text color.
                 font=(FONT_NAME, 15, "bold"))  # Set the font, size, and weight.
 
+# Define a custom style for the timer label. Its background matches the red rectangle behind it.
+style.configure("Timer.TLabel",
+                foreground="white",
+                background=RED,
+                font=(FONT_NAME, 35, "bold"))
+
 # Define a custom style for the checkmarks label.
 style.configure("Check.TLabel",
                 foreground=GREEN,
@@ -221,9 +398,15 @@ title_label.grid(column=0, row=0, columnspan=4)
 # A Canvas widget is used for drawing shapes and images.
 canvas = tkinter.Canvas(width=200, height=224, highlightthickness=0)  # Set initial size and remove border.
 
-# Draw the background rectangle and the timer text, storing their IDs in our global variables.
+# Draw the background rectangle, storing its ID in our global variable.
 rectangle_id = canvas.create_rectangle(0, 0, 200, 224, fill=RED, outline="") # This line creates the red rectangle
-timer_text_id = canvas.create_text(100, 112, text="00:00", fill="white", font=(FONT_NAME, 35, "bold")) # Change '25' to your desired font size
+
+# The timer text is a label linked to a 'StringVar'. Setting the variable updates the label,
+# and Tk only redraws it when the text really changes.
+time_var = tkinter.StringVar(value="00:00")
+timer_label = ttk.Label(canvas, textvariable=time_var, style="Timer.TLabel")
+# 'create_window' places a widget on the canvas, centred on the given point.
+timer_text_id = canvas.create_window(100, 112, window=timer_label)
 
 # Place the canvas in the grid at row 1.
 # 'sticky="nsew"' makes the canvas stick to all four sides (north, south, east, west) of its grid cell,
@@ -234,7 +417,8 @@ canvas.grid(column=0, row=1, columnspan=4, sticky="nsew")
 canvas.bind("<Configure>", on_canvas_resize)
 
 # Row 2: Checkmarks Label
-check_marks = ttk.Label(text="", style="Check.TLabel")  # Create the label for checkmarks.
+check_var = tkinter.StringVar(value="")  # Holds the checkmarks; the label below shows whatever it contains.
+check_marks = ttk.Label(textvariable=check_var, style="Check.TLabel")  # Create the label for checkmarks.
 check_marks.grid(column=0, row=2, columnspan=4)  # Place it in row 2, spanning all columns.
 
 # Row 3: Control Buttons
@@ -256,4 +440,5 @@ reset_button.grid(column=3, row=3)  # Place in row 3, column 3.
 # 'window.mainloop()' starts the tkinter event loop. This is a blocking call that keeps the
 # window open, listens for events (like button clicks and window resizing), and runs the
 # appropriate event handlers. The script will stay on this line until the window is closed.
+tick()  # Start the tick loop once; it reschedules itself for as long as the window is open.
 window.mainloop()
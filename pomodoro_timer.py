@@ -15,9 +15,9 @@ This application will teach you:
    - Event handling (what happens when user clicks)
    - Layout management (organizing widgets on screen)
 
-3. THREADING AND CONCURRENCY:
-   - Running timer in background without freezing GUI
-   - Thread-safe communication between processes
+3. EVENT SCHEDULING:
+   - Running the timer with root.after() without freezing GUI
+   - Keeping all widget updates on the main thread
 
 4. EVENT-DRIVEN PROGRAMMING:
    - Responding to user actions (clicks, window resize)
@@ -48,10 +48,15 @@ Key Features:
 Dependencies (External Libraries We Need):
 - tkinter: GUI framework (built into Python - no installation needed!)
 - pygame: Audio notification system (pip install pygame)
-- numpy: Sound wave generation (pip install numpy)
-- threading: Non-blocking timer execution (built into Python)
 - time: Timer countdown functionality (built into Python)
 
+Performance Note:
+This is GUI code - its work is tkinter widget calls, not number crunching, so
+a JIT compiler such as Numba would only add import-time cost here. Keep the
+PomodoroTimer class free of @njit decorators. Numeric helpers (like
+_synth_sine) stay plain functions, and any future statistics over the session
+history belong in a separate module that is imported only when it is needed.
+
 Author: GitHub Copilot
 Date: October 2025
 """
@@ -64,12 +69,55 @@ Date: October 2025
 # Think of them like borrowing tools from a toolbox
 
 import tkinter as tk                    # Main GUI toolkit - "tk" is a shorter nickname
-from tkinter import ttk, messagebox     # Special widgets (ttk) and popup dialogs (messagebox)
-import time                             # For time-related functions like sleep()
-import threading                        # For running timer in background
-import pygame                           # For playing notification sounds
-import os                               # Operating system interface (not used but imported)
-from datetime import datetime, timedelta  # Date/time utilities (not used but imported)
+from tkinter import ttk                 # Special, themed widgets (ttk)
+from tkinter import font as tkfont      # Reusable font objects shared between widgets
+import time                             # For time-related functions like monotonic()
+import math                             # For math helpers like ceil() and sin()
+import io                               # For building the beep's WAV file in memory
+import wave                             # For writing WAV audio data
+import sys                              # For writing the console bell straight to stdout
+from array import array                 # Compact, growable arrays of plain numbers
+from enum import IntEnum                # Named constants for the timer's states
+
+# ============================================================================
+# SHARED CACHES - RESULTS WE ONLY WANT TO COMPUTE ONCE
+# ============================================================================
+
+# PYTHON LEARNING: A module-level dictionary is shared by every PomodoroTimer object
+# Keys are (sample_rate, duration, frequency) tuples, values are ready-to-play sounds,
+# so a second timer window (or a test) reuses the sound instead of generating it again
+_SOUND_CACHE = {}
+
+# PYTHON LEARNING: List comprehensions build a whole list in one expression
+# TIME_STRINGS[150] is "02:30" - every "MM:SS" text from 00:00 to 99:59 is built once
+# at startup, so the display just looks the text up instead of formatting it each second
+TIME_STRINGS = [f"{s // 60:02d}:{s % 60:02d}" for s in range(100 * 60)]
+
+def _synth_sine(frames, frequency, sample_rate):
+    """
+    Build `frames` samples of a sine tone as a 16-bit array ('h' typecode).
+    
+    Purpose: Keeps the number crunching in one plain function, separate from
+    pygame, so it can be reused (or compiled) without touching the sound setup.
+    """
+    # PYTHON LEARNING: A generator expression feeds array() one value at a time,
+    # so no temporary list of floats is built. The beep is made only once, so the
+    # standard library is fast enough and we don't need numpy at all
+    step = 2 * math.pi * frequency / sample_rate    # Phase advance per sample (computed once)
+    sin = math.sin                                  # Local name: faster lookup in the loop
+    return array('h', (int(32767 * sin(step * i)) for i in range(frames)))
+
+class TimerState(IntEnum):
+    """
+    The state the countdown is in. Exactly one applies at any moment.
+    
+    PYTHON LEARNING: An Enum gives names to a fixed set of values, so
+    "self.state is TimerState.PAUSED" can't disagree with itself the way two
+    separate True/False flags (is_running, is_paused) could.
+    """
+    IDLE = 0        # Not started yet, reset, or finished
+    RUNNING = 1     # Counting down
+    PAUSED = 2      # Stopped part-way, can be resumed
 
 # ============================================================================
 # MAIN APPLICATION CLASS - THE HEART OF OUR PROGRAM
@@ -106,6 +154,33 @@ class PomodoroTimer:
     - Session tracking (counting completed work sessions)
     """
     
+    # PYTHON LEARNING: Class-level constants
+    # Variables defined directly in the class body are shared by all objects
+    # They are created once, not every time a method runs
+    SESSION_COLORS = {
+        "Work": "#e74c3c",           # Red for work sessions (focus/concentration)
+        "Short Break": "#f39c12",    # Orange for short breaks (brief rest)
+        "Long Break": "#9b59b6"      # Purple for long breaks (extended restoration)
+    }
+    
+    # (text, state) of the Start and Pause buttons for each timer state
+    # PYTHON LEARNING: Nested dictionaries - CONTROL_STATES[TimerState.PAUSED]["start"] is ("Resume", "normal")
+    CONTROL_STATES = {
+        TimerState.IDLE:    {"start": ("Start", "normal"),         "pause": ("Pause", "normal")},
+        TimerState.RUNNING: {"start": ("Running...", "disabled"),  "pause": ("Pause", "normal")},
+        TimerState.PAUSED:  {"start": ("Resume", "normal"),        "pause": ("Pause", "disabled")}
+    }
+    
+    # Small integer code for each session type, stored in the session history arrays
+    SESSION_KINDS = {"Work": 0, "Short Break": 1, "Long Break": 2}
+    
+    # Shared colors for the checkboxes inside the settings window frames
+    # PYTHON LEARNING: **_LABEL_STYLE "unpacks" the dict into bg=..., fg=... keyword arguments
+    _LABEL_STYLE = dict(bg="#34495e", fg="#ecf0f1")
+    
+    # Heading font shared by the settings window frames (one tuple, not one per frame)
+    _FRAME_FONT = ("Arial", 12, "bold")
+    
     def __init__(self, root):
         """
         🔧 PYTHON LEARNING: The Constructor Method (__init__)
@@ -155,6 +230,7 @@ class PomodoroTimer:
         # Make window stay on top of other applications
         # This ensures timer remains visible while working
         # PYTHON LEARNING: attributes() method sets special window properties
+        # It is set once here; the "Keep window on top" setting can turn it off later
         self.root.attributes('-topmost', True)
         
         # Store reference dimensions for responsive design calculations
@@ -162,27 +238,48 @@ class PomodoroTimer:
         self.base_width = 500   # Our "standard" width
         self.base_height = 480  # Our "standard" height
         
+        # Resize bookkeeping: the pending delayed resize and the current window size
+        # PYTHON LEARNING: Dragging a window edge fires dozens of events per second,
+        # so we wait until the dragging pauses and then update the layout once
+        self._resize_job = None
+        self._cur_w = self.base_width    # Window size from the last '<Configure>' event
+        self._cur_h = self.base_height   # (starts at the size set by geometry() above)
+        self._last_scales = None         # Clamped (width, height) scales last calculated
+        self._last_responsive = None   # Responsive values last applied to the widgets
+        self._settings_win = None      # Settings window, built on first open then reused
+        self._toast = None             # Message label for _show_toast(), built on first use
+        self._toast_job = None         # Pending after() job that hides the message
+        
         # ═══════════════════════════════════════════════════════════════
         # AUDIO SYSTEM INITIALIZATION
         # ═══════════════════════════════════════════════════════════════
         
-        # Initialize pygame's sound system with error handling
-        # PYTHON LEARNING: Some libraries need to be "initialized" before use
-        try:
-            pygame.mixer.init()
-        except:
-            # pygame not available - audio will use fallback methods
-            pass
+        # PYTHON LEARNING: Lazy initialization
+        # Starting pygame's audio system takes a noticeable moment, and some users never
+        # hear a sound (sound disabled, or no session finished). So we don't do it here:
+        # _init_sound() sets it up the first time a notification is actually played
+        self._sound_ready = False      # Has _init_sound() run yet?
+        self._notify_sound = None      # Ready-to-play pygame Sound (None = not available)
         
         # ═══════════════════════════════════════════════════════════════
         # TIMER STATE VARIABLES - KEEPING TRACK OF WHAT'S HAPPENING
         # ═══════════════════════════════════════════════════════════════
         
-        # PYTHON LEARNING: Boolean variables can only be True or False
-        # These act like on/off switches for different states
+        # PYTHON LEARNING: One state variable instead of several on/off switches
+        # TimerState.IDLE, RUNNING or PAUSED - see the TimerState class above
+        
+        self.state = TimerState.IDLE
         
-        self.is_running = False    # Is the timer currently counting down?
-        self.is_paused = False     # Is the timer paused (but not reset)?
+        # PYTHON LEARNING: None means "nothing here yet"
+        # Holds the ID of the next scheduled tick, so pause/reset can cancel it
+        self._after_id = None
+        self._hidden = False     # Is the window minimized? (ticks are spaced out then)
+        
+        # PYTHON LEARNING: Floats store decimal numbers
+        # The countdown is measured against a fixed end time instead of counting ticks,
+        # so a busy or slow event loop can never make the timer run late
+        self._deadline = 0.0              # time.monotonic() value when the session ends
+        self._remaining_at_pause = None   # Exact seconds left when paused (None = not paused)
         
         # PYTHON LEARNING: Strings store text data
         # This tracks what type of session we're in
@@ -195,6 +292,21 @@ class PomodoroTimer:
         self.session_count = 0          # How many work sessions completed
         self.completed_pomodoros = 0    # Total pomodoros finished
         
+        # PYTHON LEARNING: Parallel arrays ("structure of arrays")
+        # Finished session N is described by _sess_kind[N] and _sess_dur[N]. Keeping
+        # each field in its own packed array (instead of a list of dicts) lets future
+        # statistics like sum(self._sess_dur) run over plain numbers in one pass
+        self._sess_kind = array('b')    # SESSION_KINDS code of each finished session
+        self._sess_dur = array('i')     # Length of each finished session in seconds
+        
+        # Session currently shown on the session label (None = nothing shown yet)
+        # update_display() uses this to skip relabelling when the session hasn't changed
+        self._displayed_session = None
+        self._last_time_text = None     # Time display text last shown
+        self._last_pct = None           # Progress bar percentage last shown
+        self._display_pending = False   # Is a coalesced display refresh already scheduled?
+        self._controls_state = TimerState.IDLE   # CONTROL_STATES entry the buttons currently show
+        
         # ═══════════════════════════════════════════════════════════════
         # TIMER SETTINGS - USER CUSTOMIZABLE VALUES
         # ═══════════════════════════════════════════════════════════════
@@ -213,18 +325,48 @@ class PomodoroTimer:
         self.sound_enabled = tk.BooleanVar(value=True)        # Play sounds when sessions end?
         self.auto_start_breaks = tk.BooleanVar(value=False)   # Automatically start breaks?
         self.auto_start_work = tk.BooleanVar(value=False)     # Automatically start work?
+        self.always_on_top = tk.BooleanVar(value=True)        # Keep window above others?
+        
+        # Plain-Python copies of the settings above, so the timer reads attributes
+        # instead of asking tkinter with .get() (see _sync_settings)
+        self._sync_settings()
+        for var in (self.work_duration, self.short_break_duration, self.long_break_duration,
+                    self.long_break_interval, self.sound_enabled,
+                    self.auto_start_breaks, self.auto_start_work):
+            var.trace_add("write", self._sync_settings)
+        
+        # PYTHON LEARNING: trace_add() calls a function whenever a variable is written
+        # The window's topmost flag is only touched when the user flips the setting
+        self.always_on_top.trace_add(
+            "write", lambda *_: self.root.attributes('-topmost', self.always_on_top.get())
+        )
+        
+        # StringVar stores text and syncs with label widgets (via textvariable=)
+        # Setting the variable updates the label - no need to call .config() every second
+        self._time_var = tk.StringVar(value="25:00")          # Text of the time display
+        self._session_var = tk.StringVar(value="Work Session")  # Text of the session label
         
         # ═══════════════════════════════════════════════════════════════
         # EVENT BINDING AND FINAL SETUP
         # ═══════════════════════════════════════════════════════════════
         
-        # PYTHON LEARNING: Event Binding
+        # PYTHON LEARNING: Event Binding and Binding Tags
         # This connects window events (like resizing) to our functions
         # When user resizes window, on_window_resize() will be called
-        self.root.bind('<Configure>', self.on_window_resize)
+        # A binding made with self.root.bind() also fires for every child widget
+        # (each child lists the main window in its "bindtags"). Binding to our own
+        # tag, which only the main window carries, means tkinter never even calls
+        # Python for a child widget's events
+        self.root.bindtags(("PomodoroRoot",) + self.root.bindtags())
+        self.root.bind_class("PomodoroRoot", '<Configure>', self.on_window_resize)
+        
+        # Minimizing/restoring the window changes how often the countdown wakes up
+        self.root.bind_class("PomodoroRoot", '<Unmap>', self.on_window_unmap)
+        self.root.bind_class("PomodoroRoot", '<Map>', self.on_window_map)
         
         # Build the user interface (all the buttons, labels, etc.)
         # PYTHON LEARNING: We separate this into its own method for organization
+        self._widgets_ready = False    # Set to True once create_widgets() has finished
         self.create_widgets()
         
         # Force button colors after creation (override macOS theme)
@@ -234,6 +376,10 @@ class PomodoroTimer:
         # PYTHON LEARNING: Always good to start with everything in sync
         self.update_display()
         
+        # Get the notification sound ready shortly after the window is up, so the
+        # first session end doesn't wait for pygame to load
+        self.root.after(500, self._preload_sound)
+        
     def create_widgets(self):
         """
         🎨 PYTHON LEARNING: GUI Creation and Layout Management
@@ -278,6 +424,37 @@ class PomodoroTimer:
         # PYTHON LEARNING: This makes the interface adapt to different window sizes
         self.calculate_responsive_values()
         
+        # ═══════════════════════════════════════════════════════════════
+        # SHARED FONT OBJECTS
+        # ═══════════════════════════════════════════════════════════════
+        
+        # PYTHON LEARNING: A Font object is a named font that widgets refer to
+        # Changing its size later with .configure() updates every widget using it,
+        # instead of passing a new ("Arial", size) tuple to each widget one by one
+        self._session_font = tkfont.Font(family="Arial", size=self.session_font_size)
+        self._timer_font = tkfont.Font(family="Arial", size=self.timer_font_size, weight="bold")
+        self._button_bold_font = tkfont.Font(family="Arial", size=self.button_font_size, weight="bold")
+        self._button_font = tkfont.Font(family="Arial", size=self.button_font_size)
+        
+        # ═══════════════════════════════════════════════════════════════
+        # SHARED LABEL STYLES
+        # ═══════════════════════════════════════════════════════════════
+        
+        # PYTHON LEARNING: ttk.Style defines a look once under a name like "Time.TLabel"
+        # Every ttk.Label created with style="Time.TLabel" uses it, and configuring
+        # the style later restyles all of those labels in one call
+        # (The buttons stay tk.Button - macOS's ttk theme ignores custom button colors)
+        self._style = ttk.Style(self.root)
+        self._style.configure("Session.TLabel", font=self._session_font,
+                              background="#2c3e50", foreground=self.SESSION_COLORS["Work"])
+        self._style.configure("Time.TLabel", font=self._timer_font,
+                              background="#2c3e50", foreground="#ecf0f1")
+        self._style.configure("Settings.TLabel", background="#34495e", foreground="#ecf0f1")
+        
+        # Remember the values the widgets are built with (see _apply_resize)
+        self._last_responsive = (self.session_font_size, self.button_font_size,
+                                 self.progress_length, self.button_width)
+        
         # ═══════════════════════════════════════════════════════════════
         # MAIN CONTAINER FRAME
         # ═══════════════════════════════════════════════════════════════
@@ -302,12 +479,10 @@ class PomodoroTimer:
         # SESSION TYPE LABEL - "Work Session", "Break", etc.
         # ═══════════════════════════════════════════════════════════════
         
-        self.session_label = tk.Label(
+        self.session_label = ttk.Label(
             main_container,
-            text="Work Session",                                  # Initial text
-            font=("Arial", self.session_font_size),              # Responsive font size
-            bg="#2c3e50",                                         # Dark background
-            fg="#e74c3c"                                          # Red text color for work
+            textvariable=self._session_var,                       # Text comes from a StringVar
+            style="Session.TLabel"                                # Responsive font, dark background, session color
         )
         
         # PYTHON LEARNING: We'll change the text and color of this label
@@ -340,12 +515,10 @@ class PomodoroTimer:
         # TIME DISPLAY LABEL - "25:00"
         # ═══════════════════════════════════════════════════════════════
         
-        self.time_label = tk.Label(
+        self.time_label = ttk.Label(
             timer_container,                                      # Parent is the fixed container
-            text="25:00",                                        # Initial time display
-            font=("Arial", self.timer_font_size, "bold"),       # Large, bold font
-            bg="#2c3e50",                                        # Dark background
-            fg="#ecf0f1"                                         # Light text color
+            textvariable=self._time_var,                         # Time display text (StringVar)
+            style="Time.TLabel"                                  # Large bold font, light text on dark background
         )
         
         # Center the time display vertically in its container
@@ -381,9 +554,8 @@ class PomodoroTimer:
         control_frame = tk.Frame(main_container, bg="#2c3e50")
         control_frame.pack(pady=self.controls_pady)
         
-        # Calculate responsive button width
-        # PYTHON LEARNING: max() ensures minimum width, int() converts to whole number
-        button_width = max(8, int(10 * (self.root.winfo_width() / self.base_width)))
+        # Responsive button width (calculated in calculate_responsive_values)
+        button_width = self.button_width
         
         # ═══════════════════════════════════════════════════════════════
         # START BUTTON - GREEN "START" BUTTON
@@ -393,7 +565,7 @@ class PomodoroTimer:
         self.start_button = tk.Button(
             control_frame,                                  # Parent container
             text="Start",                                   # Button label
-            font=("Arial", self.button_font_size, "bold"), # Font styling
+            font=self._button_bold_font,                    # Font styling
             bg="#27ae60",                                   # Green background (go/start color)
             fg="white",                                     # White text
             width=button_width,                             # Responsive width
@@ -416,7 +588,7 @@ class PomodoroTimer:
         self.pause_button = tk.Button(
             control_frame,
             text="Pause",
-            font=("Arial", self.button_font_size, "bold"),
+            font=self._button_bold_font,
             bg="#f39c12",                                   # Orange background (caution/pause color)
             fg="white",
             width=button_width,
@@ -437,7 +609,7 @@ class PomodoroTimer:
         self.reset_button = tk.Button(
             control_frame,
             text="Reset",
-            font=("Arial", self.button_font_size, "bold"),
+            font=self._button_bold_font,
             bg="#e74c3c",                                   # Red background (stop/danger color)
             fg="white",
             width=button_width,
@@ -470,7 +642,7 @@ class PomodoroTimer:
         self.settings_button = tk.Button(
             settings_container,
             text="⚙️ Settings",                             # Gear emoji + text
-            font=("Arial", self.button_font_size),
+            font=self._button_font,
             bg="#9b59b6",                                   # Purple background (settings color)
             fg="white",
             relief="flat",                                  # Flat relief to override system styling
@@ -483,6 +655,13 @@ class PomodoroTimer:
         
         # Center the settings button
         self.settings_button.pack()
+        
+        # The three control buttons share a bold font and a responsive width,
+        # so keep them together for update_widget_styling() to loop over
+        self._bold_buttons = (self.start_button, self.pause_button, self.reset_button)
+        
+        # Every widget exists now, so update_widget_styling() may touch them
+        self._widgets_ready = True
 
     def create_settings_window(self):
         """
@@ -497,81 +676,50 @@ class PomodoroTimer:
         settings_window.geometry("400x500")
         settings_window.configure(bg="#2c3e50")
         
+        # Keep the window around: closing it only hides it, and open_settings() shows it again
+        self._settings_win = settings_window
+        settings_window.protocol("WM_DELETE_WINDOW", settings_window.withdraw)
+        
         # Duration settings
         duration_frame = tk.LabelFrame(
             settings_window,
             text="Timer Durations (minutes)",
-            font=("Arial", 12, "bold"),
+            font=self._FRAME_FONT,
             bg="#34495e",
             fg="#ecf0f1"
         )
         duration_frame.pack(pady=10, padx=20, fill=tk.X)
         
-        # Work duration
-        tk.Label(duration_frame, text="Work Duration:", bg="#34495e", fg="#ecf0f1").grid(row=0, column=0, sticky="w", padx=5, pady=5)
-        work_spinbox = tk.Spinbox(duration_frame, from_=1, to=60, textvariable=self.work_duration, width=10)
-        work_spinbox.grid(row=0, column=1, padx=5, pady=5)
-        
-        # Short break duration
-        tk.Label(duration_frame, text="Short Break:", bg="#34495e", fg="#ecf0f1").grid(row=1, column=0, sticky="w", padx=5, pady=5)
-        short_break_spinbox = tk.Spinbox(duration_frame, from_=1, to=30, textvariable=self.short_break_duration, width=10)
-        short_break_spinbox.grid(row=1, column=1, padx=5, pady=5)
-        
-        # Long break duration
-        tk.Label(duration_frame, text="Long Break:", bg="#34495e", fg="#ecf0f1").grid(row=2, column=0, sticky="w", padx=5, pady=5)
-        long_break_spinbox = tk.Spinbox(duration_frame, from_=1, to=60, textvariable=self.long_break_duration, width=10)
-        long_break_spinbox.grid(row=2, column=1, padx=5, pady=5)
-        
-        # Long break interval
-        tk.Label(duration_frame, text="Long Break Interval:", bg="#34495e", fg="#ecf0f1").grid(row=3, column=0, sticky="w", padx=5, pady=5)
-        interval_spinbox = tk.Spinbox(duration_frame, from_=2, to=10, textvariable=self.long_break_interval, width=10)
-        interval_spinbox.grid(row=3, column=1, padx=5, pady=5)
+        # One (label, variable, minimum, maximum) row per duration setting
+        duration_rows = [
+            ("Work Duration:", self.work_duration, 1, 60),
+            ("Short Break:", self.short_break_duration, 1, 30),
+            ("Long Break:", self.long_break_duration, 1, 60),
+            ("Long Break Interval:", self.long_break_interval, 2, 10)
+        ]
+        for row, (text, var, lo, hi) in enumerate(duration_rows):
+            self._spin_row(duration_frame, row, text, var, lo, hi)
         
         # Sound and automation settings
         options_frame = tk.LabelFrame(
             settings_window,
             text="Options",
-            font=("Arial", 12, "bold"),
+            font=self._FRAME_FONT,
             bg="#34495e",
             fg="#ecf0f1"
         )
         options_frame.pack(pady=10, padx=20, fill=tk.X)
         
-        sound_check = tk.Checkbutton(
-            options_frame,
-            text="Enable sound notifications",
-            variable=self.sound_enabled,
-            bg="#34495e",
-            fg="#ecf0f1",
-            selectcolor="#2c3e50"
-        )
-        sound_check.pack(anchor="w", padx=5, pady=5)
-        
-        auto_break_check = tk.Checkbutton(
-            options_frame,
-            text="Auto-start breaks",
-            variable=self.auto_start_breaks,
-            bg="#34495e",
-            fg="#ecf0f1",
-            selectcolor="#2c3e50"
-        )
-        auto_break_check.pack(anchor="w", padx=5, pady=5)
-        
-        auto_work_check = tk.Checkbutton(
-            options_frame,
-            text="Auto-start work sessions",
-            variable=self.auto_start_work,
-            bg="#34495e",
-            fg="#ecf0f1",
-            selectcolor="#2c3e50"
-        )
-        auto_work_check.pack(anchor="w", padx=5, pady=5)
+        self._check_row(options_frame, "Enable sound notifications", self.sound_enabled)
+        self._check_row(options_frame, "Auto-start breaks", self.auto_start_breaks)
+        self._check_row(options_frame, "Auto-start work sessions", self.auto_start_work)
+        self._check_row(options_frame, "Keep window on top", self.always_on_top)
         
         # Theme selection
         theme_frame = tk.LabelFrame(
             settings_window,
             text="Timer Modes",
-            font=("Arial", 12, "bold"),
+            font=self._FRAME_FONT,
             bg="#34495e",
             fg="#ecf0f1"
         )
@@ -607,7 +755,7 @@ class PomodoroTimer:
             text="Save Settings",
             bg="#27ae60",
             fg="white",
-            command=lambda: [self.save_settings(), settings_window.destroy()]
+            command=lambda: [self.save_settings(), settings_window.withdraw()]
         )
         save_button.pack(side=tk.LEFT, padx=5)
         
@@ -616,10 +764,32 @@ class PomodoroTimer:
             text="Cancel",
             bg="#e74c3c",
             fg="white",
-            command=settings_window.destroy
+            command=settings_window.withdraw
         )
         cancel_button.pack(side=tk.LEFT, padx=5)
         
+    def _spin_row(self, frame, row, text, var, lo, hi):
+        """
+        Add a "label + spinbox" row to a settings frame's grid.
+        
+        Purpose: Builds each duration setting from the same few lines, so
+        every row is styled and laid out identically.
+        """
+        ttk.Label(frame, text=text, style="Settings.TLabel").grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        tk.Spinbox(frame, from_=lo, to=hi, textvariable=var, width=10).grid(row=row, column=1, padx=5, pady=5)
+        
+    def _check_row(self, frame, text, var):
+        """
+        Add a checkbox bound to a BooleanVar to a settings frame.
+        """
+        tk.Checkbutton(
+            frame,
+            text=text,
+            variable=var,
+            selectcolor="#2c3e50",
+            **self._LABEL_STYLE
+        ).pack(anchor="w", padx=5, pady=5)
+        
     def set_classic_mode(self):
         """
         Configure Classic Pomodoro Technique Settings
@@ -644,13 +814,45 @@ class PomodoroTimer:
         self.long_break_duration.set(30)
         self.long_break_interval.set(3)
         
+    def _sync_settings(self, *_):
+        """
+        Copy the settings variables into plain attributes.
+        
+        Purpose: Runs once at start-up and then whenever a setting variable is
+        written (via trace_add), so the timer code never has to call .get().
+        Session lengths are stored in seconds, keyed by session name.
+        """
+        self._sound_on = self.sound_enabled.get()
+        self._auto_breaks = self.auto_start_breaks.get()
+        self._auto_work = self.auto_start_work.get()
+        
+        # PYTHON LEARNING: A spinbox being typed into can briefly hold text that isn't
+        # a number (e.g. empty), and .get() raises TclError - keep the last good values
+        try:
+            session_seconds = {
+                "Work": self.work_duration.get() * 60,
+                "Short Break": self.short_break_duration.get() * 60,
+                "Long Break": self.long_break_duration.get() * 60
+            }
+            long_interval = self.long_break_interval.get()
+        except tk.TclError:
+            return
+        self._session_seconds = session_seconds
+        self._long_interval = long_interval
+        
     def open_settings(self):
         """
         Launch Settings Configuration Window
         
         Purpose: Creates and displays the settings window when user clicks
-        the settings button.
+        the settings button. After the first time, the hidden window is shown again.
         """
+        # PYTHON LEARNING: The widgets are bound to our tkinter variables, so a
+        # reused window always shows the current settings without rebuilding it
+        if self._settings_win is not None and self._settings_win.winfo_exists():
+            self._settings_win.deiconify()
+            self._settings_win.lift()
+            return
         self.create_settings_window()
         
     def save_settings(self):
@@ -660,20 +862,54 @@ class PomodoroTimer:
         Purpose: Applies all user-modified settings and refreshes the timer
         display to reflect new configurations.
         """
-        if not self.is_running:
+        if self.state is not TimerState.RUNNING:
             self.reset_timer()
-        messagebox.showinfo("Settings", "Settings saved successfully!")
+            
+        # The settings window closes right after saving, so confirm on the main window
+        # A toast doesn't block the event loop the way messagebox.showinfo() does
+        self._show_toast("Settings saved successfully!")
+        
+    def _show_toast(self, text, duration_ms=1500):
+        """
+        Show a short message across the top of the main window that hides itself.
+        
+        Purpose: Informs the user without a modal dialog, so countdown ticks
+        keep firing while the message is visible. One label is created on
+        first use and then reused for every message.
+        """
+        if self._toast is None:
+            self._toast = tk.Label(self.root, bg="#27ae60", fg="white",
+                                   font=("Arial", 10, "bold"), padx=10, pady=4)
+        self._toast.config(text=text)
+        
+        # PYTHON LEARNING: place() floats the label over the other widgets,
+        # so showing and hiding it never shifts the layout
+        # It goes at the top edge, above the session label: the Settings button sits
+        # at the bottom, and a message covering it would block clicks while it shows
+        self._toast.place(relx=0.5, rely=0.0, anchor="n", y=4)
+        
+        # A newer message restarts the countdown to hiding the label
+        if self._toast_job is not None:
+            self.root.after_cancel(self._toast_job)
+        self._toast_job = self.root.after(duration_ms, self._hide_toast)
+        
+    def _hide_toast(self):
+        """
+        Hide the message shown by _show_toast() (the label is kept for reuse).
+        """
+        self._toast_job = None
+        self._toast.place_forget()
         
     def start_timer(self):
         """
-        🚀 PYTHON LEARNING: Timer Control and Threading
-        ==============================================
+        🚀 PYTHON LEARNING: Timer Control and Event Scheduling
+        =====================================================
         
         This method handles starting or resuming the timer. It demonstrates several
         important Python concepts:
         
         1. CONDITIONAL LOGIC: Using if/elif/else to make decisions
-        2. THREADING: Running tasks in the background
+        2. EVENT SCHEDULING: Asking tkinter to call us back later
         3. STATE MANAGEMENT: Coordinating multiple variables
         4. METHOD CALLS: How methods work together
         
@@ -681,74 +917,72 @@ class PomodoroTimer:
         1. Check if we're starting fresh or resuming
         2. If starting fresh, calculate time based on session type
         3. Update button states to show timer is running
-        4. Create and start a background thread for countdown
+        4. Schedule the first countdown tick with root.after()
         
-        WHY USE THREADING:
-        - GUI runs on main thread (handles user clicks, updates display)
-        - Timer countdown runs on separate thread (counts seconds)
-        - This prevents GUI from "freezing" during countdown
+        WHY USE root.after() INSTEAD OF A THREAD:
+        - tkinter's event loop already knows how to run code later
+        - after() returns immediately, so the GUI never "freezes"
+        - Everything runs on the main thread, so widgets can be updated safely
         """
         
+        # ═══════════════════════════════════════════════════════════════
+        # IGNORE REPEATED STARTS
+        # ═══════════════════════════════════════════════════════════════
+        
+        # If the timer is already counting down (e.g., an auto-start arrives right
+        # after the user clicked Start), starting again would schedule a second
+        # chain of ticks and make the countdown run twice as fast
+        # PYTHON LEARNING: Guard clause - exit early if there's nothing to do
+        if self.state is TimerState.RUNNING or self._after_id is not None:
+            return
+            
         # ═══════════════════════════════════════════════════════════════
         # DETERMINE SESSION DURATION (ONLY IF STARTING FRESH)
         # ═══════════════════════════════════════════════════════════════
         
         # PYTHON LEARNING: Conditional Logic (if/elif/else)
         # Check if we're starting a brand new session (not resuming a pause)
-        if not self.is_running and not self.is_paused:
+        if self.state is not TimerState.PAUSED:
             
-            # PYTHON LEARNING: Dictionary-like logic using if/elif
-            # Determine how many seconds based on current session type
-            if self.current_session == "Work":
-                # Get user's work duration setting and convert minutes to seconds
-                # PYTHON LEARNING: .get() method retrieves value from tkinter variable
-                self.time_left = self.work_duration.get() * 60
-                
-            elif self.current_session == "Short Break":
-                self.time_left = self.short_break_duration.get() * 60
-                
-            else:  # Must be "Long Break"
-                # PYTHON LEARNING: else clause handles remaining cases
-                self.time_left = self.long_break_duration.get() * 60
+            # PYTHON LEARNING: Dictionary lookup instead of if/elif
+            # Look up how many seconds this session type lasts (already in seconds)
+            self.time_left = self._session_seconds[self.current_session]
             
             # Store total time for progress bar calculation
             # PYTHON LEARNING: We need this reference because time_left will decrease
             self.total_time = self.time_left
             
         # ═══════════════════════════════════════════════════════════════
-        # UPDATE TIMER STATE AND BUTTON APPEARANCE
+        # SET THE DEADLINE - WHEN THIS SESSION WILL END
         # ═══════════════════════════════════════════════════════════════
         
-        # Set state flags to indicate timer is active
-        # PYTHON LEARNING: Boolean variables act like switches
-        self.is_running = True      # Timer is counting down
-        self.is_paused = False      # Clear any previous pause state
-        
-        # Update start button to show timer is running
-        # PYTHON LEARNING: .config() method changes widget properties after creation
-        self.start_button.config(
-            text="Running...",      # Change button text
-            state="disabled"        # Disable button to prevent double-clicking
-        )
+        # When resuming, continue from the exact (sub-second) time left at pause
+        # PYTHON LEARNING: "is not None" distinguishes "no value" from a value of 0
+        if self._remaining_at_pause is not None:
+            remaining = self._remaining_at_pause
+            self._remaining_at_pause = None
+        else:
+            remaining = self.time_left
+            
+        # PYTHON LEARNING: time.monotonic() is a clock that never jumps backwards
+        # (unlike the wall clock, which can change when the computer adjusts its time)
+        self._deadline = time.monotonic() + remaining
         
         # ═══════════════════════════════════════════════════════════════
-        # CREATE AND START BACKGROUND TIMER THREAD
+        # UPDATE TIMER STATE AND BUTTON APPEARANCE
         # ═══════════════════════════════════════════════════════════════
         
-        # PYTHON LEARNING: Threading - Running Code in the Background
-        # Create a new thread that will run our timer countdown
-        timer_thread = threading.Thread(
-            target=self.run_timer    # Function to run in the background
-        )
+        # The timer is now counting down (this also clears any pause)
+        self.state = TimerState.RUNNING
         
-        # PYTHON LEARNING: Daemon Threads
-        # daemon=True means thread will automatically close when main program exits
-        # Without this, program might not close properly
-        timer_thread.daemon = True
+        # Start button shows "Running..." and is disabled to prevent double-clicking
+        self._set_controls_state(TimerState.RUNNING)
         
-        # Start the background thread (begins countdown)
-        # PYTHON LEARNING: .start() method begins thread execution
-        timer_thread.start()
+        # ═══════════════════════════════════════════════════════════════
+        # SCHEDULE THE FIRST COUNTDOWN TICK
+        # ═══════════════════════════════════════════════════════════════
+        
+        self._schedule_tick(remaining)
         
     def pause_timer(self):
         """
@@ -769,23 +1003,17 @@ class PomodoroTimer:
         
         # Only allow pausing if timer is currently running
         # PYTHON LEARNING: Guard clause - exit early if condition not met
-        if self.is_running:
+        if self.state is TimerState.RUNNING:
             
-            # Update state flags
-            # PYTHON LEARNING: Notice we set paused BEFORE clearing running
-            self.is_paused = True       # Remember we're paused (for resume)
-            self.is_running = False     # Stop the countdown loop
+            # Switch to paused and stop the countdown loop
+            self.state = TimerState.PAUSED   # Remember we're paused (for resume)
+            self._cancel_tick()         # Drop the already-scheduled next tick
             
-            # Update button states to reflect paused condition
-            # PYTHON LEARNING: Multiple widget updates to keep UI consistent
-            self.start_button.config(
-                text="Resume",          # Button now says "Resume" instead of "Start"
-                state="normal"          # Re-enable button for clicking
-            )
+            # Remember exactly how much time was left (including fractions of a second)
+            self._remaining_at_pause = max(0.0, self._deadline - time.monotonic())
             
-            self.pause_button.config(
-                state="disabled"        # Disable pause button (already paused!)
-            )
+            # Start button now says "Resume"; pause button is disabled (already paused!)
+            self._set_controls_state(TimerState.PAUSED)
         
     def reset_timer(self):
         """
@@ -801,7 +1029,7 @@ class PomodoroTimer:
         
         RESET PROCESS:
         1. Stop any running timer
-        2. Clear all state flags
+        2. Return to the IDLE state
         3. Return to "Work" session
         4. Reset time to current work duration
         5. Restore button states
@@ -812,10 +1040,11 @@ class PomodoroTimer:
         # STOP ALL TIMER ACTIVITY
         # ═══════════════════════════════════════════════════════════════
         
-        # Clear all running/paused states
+        # Clear the running/paused state
         # PYTHON LEARNING: Always good to be explicit about state changes
-        self.is_running = False     # Stop countdown if running
-        self.is_paused = False      # Clear pause state
+        self.state = TimerState.IDLE     # Neither running nor paused
+        self._cancel_tick()         # Drop any scheduled countdown tick
+        self._remaining_at_pause = None  # Forget any paused progress
         
         # ═══════════════════════════════════════════════════════════════
         # RESET TO INITIAL SESSION STATE
@@ -825,25 +1054,17 @@ class PomodoroTimer:
         # PYTHON LEARNING: String assignment changes the session type
         self.current_session = "Work"
         
-        # Reset time to current work duration setting
+        # Reset time to the current work duration setting
         # PYTHON LEARNING: This uses current user settings (might have changed!)
-        self.time_left = self.work_duration.get() * 60
+        self.time_left = self._session_seconds["Work"]
         self.total_time = self.time_left
         
         # ═══════════════════════════════════════════════════════════════
         # RESTORE BUTTON STATES TO INITIAL APPEARANCE
         # ═══════════════════════════════════════════════════════════════
         
-        # Reset start button to initial state
-        self.start_button.config(
-            text="Start",           # Back to original text
-            state="normal"          # Re-enable for clicking
-        )
-        
-        # Reset pause button to initial state
-        self.pause_button.config(
-            state="normal"          # Re-enable for clicking
-        )
+        # Start and pause buttons go back to their initial text and state
+        self._set_controls_state(TimerState.IDLE)
         
         # ═══════════════════════════════════════════════════════════════
         # UPDATE DISPLAY TO REFLECT RESET STATE
@@ -853,74 +1074,89 @@ class PomodoroTimer:
         # This updates all the visual elements to show the reset state
         self.update_display()
         
-    def run_timer(self):
+    def _set_controls_state(self, state):
         """
-        ⏰ PYTHON LEARNING: Threading, Loops, and Thread-Safe Communication
-        ==================================================================
+        Show the Start/Pause buttons for a TimerState (IDLE, RUNNING or PAUSED).
         
-        This is the CORE TIMER ENGINE that runs in a background thread. It shows:
+        Purpose: Every control transition goes through this one place, and the
+        buttons are only reconfigured when the state actually changes.
+        """
+        if state == self._controls_state:
+            return
+        self._controls_state = state
         
-        1. WHILE LOOPS: Repeating code while a condition is true
-        2. SLEEP FUNCTION: Pausing execution for precise timing
-        3. THREAD SAFETY: Safely communicating between threads
-        4. LOOP CONDITIONS: Using multiple conditions to control loops
+        buttons = self.CONTROL_STATES[state]
+        start_text, start_state = buttons["start"]
+        pause_text, pause_state = buttons["pause"]
+        self.start_button.config(text=start_text, state=start_state)
+        self.pause_button.config(text=pause_text, state=pause_state)
         
-        BACKGROUND THREAD CONCEPTS:
-        - This function runs separately from the main GUI
-        - It counts down seconds without freezing the interface
-        - Uses root.after() to safely update GUI from background thread
-        - Exits cleanly when timer completes or is stopped
+    def _cancel_tick(self):
+        """
+        Cancel the pending countdown tick (if there is one).
         
-        THREAD SAFETY:
-        - Never update GUI directly from background thread
-        - Use root.after() to schedule GUI updates on main thread
-        - This prevents crashes and display issues
+        Purpose: Used by pause and reset so an already-scheduled tick
+        doesn't keep counting down after the user stopped the timer.
         """
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+            
+    def _schedule_tick(self, remaining):
+        """
+        Schedule the next countdown tick for the moment the display should change.
         
-        # ═══════════════════════════════════════════════════════════════
-        # MAIN COUNTDOWN LOOP
-        # ═══════════════════════════════════════════════════════════════
+        Purpose: Wakes up just after the next whole-second boundary of the
+        countdown (e.g., 1499.3s left -> wake in ~300ms) so the display
+        changes exactly on time. While the window is minimized nobody can see
+        the display, so it only wakes on 5-second boundaries (the last one is
+        the end of the session, so the session still finishes on time).
+        """
+        step = 5 if self._hidden else 1
         
-        # PYTHON LEARNING: while loop with multiple conditions
-        # Continue looping while BOTH conditions are true:
-        # 1. time_left > 0 (still have time remaining)
-        # 2. self.is_running (timer hasn't been paused/stopped)
-        while self.time_left > 0 and self.is_running:
-            
-            # PYTHON LEARNING: time.sleep() pauses execution
-            # Sleep for exactly 1 second (this creates our countdown interval)
-            time.sleep(1)
-            
-            # PYTHON LEARNING: Double-check state after sleep
-            # User might have paused timer while we were sleeping!
-            if self.is_running:
-                
-                # Decrement remaining time by 1 second
-                # PYTHON LEARNING: -= operator subtracts and assigns in one step
-                self.time_left -= 1
-                
-                # PYTHON LEARNING: Thread-Safe GUI Updates
-                # Schedule display update on main thread (safe from background)
-                # root.after(0, function) means "run function immediately on main thread"
-                self.root.after(0, self.update_display)
-                
-        # ═══════════════════════════════════════════════════════════════
-        # HANDLE TIMER COMPLETION
-        # ═══════════════════════════════════════════════════════════════
+        # PYTHON LEARNING: remaining % 1 is the fractional part (1499.3 % 1 = 0.3)
+        # root.after(milliseconds, function) asks tkinter to call self._tick later
+        # We keep the returned ID so pause/reset can cancel the pending tick
+        delay_ms = int((remaining % step) * 1000) + 1
+        self._after_id = self.root.after(delay_ms, self._tick)
         
-        # Check if timer completed naturally (time reached zero)
-        # PYTHON LEARNING: Verify both conditions to be sure timer finished normally
-        if self.time_left <= 0 and self.is_running:
-            
-            # Final display update to show 00:00
-            self.root.after(0, self.update_display)
-            
-            # Brief pause to let user see 00:00
-            time.sleep(0.1)
-            
-            # Schedule completion handler on main thread
-            # PYTHON LEARNING: Another thread-safe GUI operation
-            self.root.after(0, self.timer_finished)
+    def _tick(self):
+        """
+        ⏰ PYTHON LEARNING: Event-Driven Loops with root.after()
+        =======================================================
+        
+        This is the CORE TIMER ENGINE. It runs once per second on the main thread:
+        
+        1. SELF-SCHEDULING: Each tick schedules the next one with root.after()
+        2. GUARD CLAUSES: Stop immediately if the timer was paused or reset
+        3. STATE UPDATES: Work out the time left from the deadline and refresh the display
+        4. COMPLETION: Hand over to timer_finished() when time runs out
+        
+        WHY NO while LOOP:
+        - A while loop with time.sleep() would freeze the GUI
+        - Instead, each call does one second of work and returns right away
+        - tkinter calls us again a second later, keeping the window responsive
+        """
+        
+        # This tick is running now, so there's nothing left to cancel
+        self._after_id = None
+        
+        # PYTHON LEARNING: Guard clause - exit early if timer was paused/reset
+        if self.state is not TimerState.RUNNING:
+            return
+        
+        # Work out how much time is left by comparing the deadline with "now"
+        # PYTHON LEARNING: math.ceil() rounds up (1499.3 -> 1500), so the display
+        # shows the full session length first and reaches 00:00 exactly at the deadline
+        remaining = max(0.0, self._deadline - time.monotonic())
+        self.time_left = math.ceil(remaining)
+        
+        # Either finish the session or schedule the next tick
+        if self.time_left <= 0:
+            self.timer_finished()
+        else:
+            self._request_display_update()
+            self._schedule_tick(remaining)
             
     def timer_finished(self):
         """
@@ -932,7 +1168,7 @@ class PomodoroTimer:
         1. COMPLEX CONDITIONAL LOGIC: Different behavior based on session type
         2. MATHEMATICAL OPERATIONS: Using modulo (%) for cycling behavior
         3. AUTOMATED DECISION MAKING: Computer choosing next action
-        4. USER INTERACTION: Optional automation vs manual confirmation
+        4. USER INTERACTION: Optional automation vs a prompt to start manually
         5. METHOD COORDINATION: Calling multiple methods in sequence
         
         SESSION TRANSITION LOGIC:
@@ -943,7 +1179,7 @@ class PomodoroTimer:
         AUTOMATION OPTIONS:
         - Auto-start breaks: Immediately begin break without asking
         - Auto-start work: Immediately resume work after break
-        - Manual mode: Show dialog and wait for user confirmation
+        - Manual mode: Show a short message and wait for the user to click Start
         """
         
         # ═══════════════════════════════════════════════════════════════
@@ -952,11 +1188,16 @@ class PomodoroTimer:
         
         # Immediately stop timer
         # PYTHON LEARNING: Always update state first
-        self.is_running = False
+        self.state = TimerState.IDLE
+        self._remaining_at_pause = None
+        
+        # Record the finished session in the history arrays
+        self._sess_kind.append(self.SESSION_KINDS[self.current_session])
+        self._sess_dur.append(self.total_time)
         
         # Play sound notification if user has enabled it
-        # PYTHON LEARNING: .get() method retrieves value from BooleanVar
-        if self.sound_enabled.get():
+        # (_sound_on mirrors the sound_enabled BooleanVar - see _sync_settings)
+        if self._sound_on:
             self.play_notification_sound()
             
         # ═══════════════════════════════════════════════════════════════
@@ -974,23 +1215,23 @@ class PomodoroTimer:
             # Determine if it's time for a long break
             # session_count % interval == 0 means evenly divisible
             # Example: if interval=4, long break after sessions 4, 8, 12, etc.
-            if self.session_count % self.long_break_interval.get() == 0:
+            if self.session_count % self._long_interval == 0:
                 self.current_session = "Long Break"
             else:
                 self.current_session = "Short Break"
                 
             # Handle automatic vs manual break starting
             # PYTHON LEARNING: Conditional automation
-            if self.auto_start_breaks.get():
-                # Automatically start break after 1 second delay
-                # PYTHON LEARNING: root.after(delay, function) schedules future execution
-                self.root.after(1000, self.start_timer)
+            if self._auto_breaks:
+                # Automatically start the break as soon as this method has finished
+                # PYTHON LEARNING: root.after_idle(function) runs it once tkinter is idle
+                self.root.after_idle(self.start_timer)
             else:
-                # Show dialog asking user to start break manually
+                # Tell the user to start the break manually (without blocking the window)
                 # PYTHON LEARNING: f-strings for dynamic text formatting
-                messagebox.showinfo(
-                    "Session Complete", 
-                    f"Work session complete! Time for a {self.current_session.lower()}."
+                self._show_toast(
+                    f"Work session complete! Time for a {self.current_session.lower()}.",
+                    duration_ms=5000
                 )
                 
         # ═══════════════════════════════════════════════════════════════
@@ -1004,14 +1245,14 @@ class PomodoroTimer:
             self.current_session = "Work"
             
             # Handle automatic vs manual work resumption
-            if self.auto_start_work.get():
-                # Automatically resume work after 1 second delay
-                self.root.after(1000, self.start_timer)
+            if self._auto_work:
+                # Automatically resume work as soon as this method has finished
+                self.root.after_idle(self.start_timer)
             else:
-                # Show dialog asking user to resume work manually
-                messagebox.showinfo(
-                    "Break Complete", 
-                    "Break time is over! Ready for another work session?"
+                # Tell the user to resume work manually
+                self._show_toast(
+                    "Break time is over! Ready for another work session?",
+                    duration_ms=5000
                 )
         
         # ═══════════════════════════════════════════════════════════════
@@ -1020,59 +1261,114 @@ class PomodoroTimer:
         
         # Reset buttons to normal state for next session
         # PYTHON LEARNING: Always restore UI state after operations
-        self.start_button.config(text="Start", state="normal")
-        self.pause_button.config(state="normal")
+        self._set_controls_state(TimerState.IDLE)
         
-        # Prepare display for next session
-        # PYTHON LEARNING: Method calls to coordinate complex operations
-        self.reset_for_new_session()
+        # Prepare the next session: its full length, and the display to match
+        # PYTHON LEARNING: Chained assignment sets both variables to the same value
+        self.time_left = self.total_time = self._session_seconds[self.current_session]
+        self.update_display()
         
-    def reset_for_new_session(self):
+    def _preload_sound(self):
         """
-        🔄 PYTHON LEARNING: State Preparation and Method Separation
-        ==========================================================
-        
-        This method prepares the timer for the next session type. It shows:
+        Set up the notification sound in advance (only if sounds are enabled).
         
-        1. SEPARATION OF CONCERNS: One method, one responsibility
-        2. LOOKUP LOGIC: Using current session to determine duration
-        3. STATE COORDINATION: Setting multiple related variables
-        4. METHOD DELEGATION: Calling other methods to complete the work
+        Purpose: Runs once, just after start-up, so the first beep plays at once.
+        With sounds turned off, pygame is never loaded at all.
+        """
+        if self._sound_on:
+            self._init_sound()
+            
+    def _init_sound(self):
+        """
+        Start pygame's audio system and build the notification sound (first use only).
         
-        WHY SEPARATE METHOD:
-        - Keeps timer_finished() focused on transition logic
-        - Reusable for other situations that need session preparation
-        - Easier to test and debug individual pieces
-        - Clean code organization
+        Purpose: Defers the pygame import and mixer start-up until a sound is
+        actually needed, so the app window opens without waiting for them.
         """
         
-        # ═══════════════════════════════════════════════════════════════
-        # DETERMINE DURATION FOR NEXT SESSION
-        # ═══════════════════════════════════════════════════════════════
+        # PYTHON LEARNING: Guard clause - only ever do this work once
+        if self._sound_ready:
+            return
+        self._sound_ready = True
         
-        # PYTHON LEARNING: if/elif/else logic for lookup
-        # Set appropriate duration based on what session type we're preparing for
-        if self.current_session == "Work":
-            # Get current work duration setting (user might have changed it!)
-            self.time_left = self.work_duration.get() * 60
-            
-        elif self.current_session == "Short Break":
-            self.time_left = self.short_break_duration.get() * 60
+        # Initialize pygame's sound system with error handling
+        # PYTHON LEARNING: Importing inside a function delays the cost until it's needed
+        try:
+            import pygame
+        except ImportError:
+            # pygame not installed - audio will use fallback methods
+            return
             
-        else:  # Must be "Long Break"
-            self.time_left = self.long_break_duration.get() * 60
+        # PYTHON LEARNING: Catch only the errors we expect, so real bugs still show up
+        try:
+            # Stereo 16-bit at 22050Hz, the rate used in _build_notification_sound
+            # (pygame copies the mono beep to both channels when it loads it)
+            # A 512-sample buffer starts playback sooner than SDL's default of 4096
+            pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+        except (pygame.error, OSError):
+            # No usable audio device - audio will use fallback methods
+            return
             
-        # ═══════════════════════════════════════════════════════════════
-        # UPDATE RELATED STATE AND DISPLAY
-        # ═══════════════════════════════════════════════════════════════
+        self._notify_sound = self._build_notification_sound()
         
-        # Store total time for progress calculation
-        # PYTHON LEARNING: Keep reference to original value before countdown begins
-        self.total_time = self.time_left
+    def _build_notification_sound(self):
+        """
+        🎵 PYTHON LEARNING: Pre-computing Expensive Results
+        ===================================================
         
-        # Update all display elements to show new session information
-        # PYTHON LEARNING: Delegate display updates to specialized method
-        self.update_display()
+        Generates the notification beep as an in-memory WAV file and returns a
+        ready-to-play pygame Sound object, or None if pygame isn't available.
+        
+        WHY BUILD IT ONCE:
+        - The sound never changes, so there's no need to rebuild it every session
+        - Session completion then only has to call .play()
+        """
+        
+        try:
+            # Try to import pygame for playing the generated sound
+            import pygame
+        except ImportError:
+            # pygame not available
+            return None
+            
+        # Audio parameters for pleasant notification sound
+        sample_rate = 22050     # CD-quality sample rate
+        duration = 0.5          # Half-second notification
+        frequency = 800         # Pleasant 800Hz tone
+        
+        # Reuse the sound if one with the same parameters was already built
+        # PYTHON LEARNING: Tuples can be dictionary keys because they can't change
+        key = (sample_rate, duration, frequency)
+        cached = _SOUND_CACHE.get(key)
+        if cached is not None:
+            return cached
+        
+        # Calculate number of audio frames needed
+        frames = int(duration * sample_rate)
+        
+        # Generate sine wave audio data in 16-bit format
+        samples = _synth_sine(frames, frequency, sample_rate)
+        
+        # Wrap the samples in a mono WAV file that lives in memory (no disk access)
+        # PYTHON LEARNING: "with" closes the WAV writer, which fills in its header
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wav:
+            wav.setnchannels(1)       # Mono
+            wav.setsampwidth(2)       # 2 bytes = 16-bit samples
+            wav.setframerate(sample_rate)
+            wav.writeframes(samples.tobytes())
+        buffer.seek(0)
+        
+        # pygame reads the WAV like a file and converts it to the mixer's format
+        try:
+            sound = pygame.mixer.Sound(file=buffer)
+        except (pygame.error, OSError, ValueError):
+            # The audio system failed or rejected the sound data
+            return None
+            
+        # Remember the sound for next time, then hand it back
+        _SOUND_CACHE[key] = sound
+        return sound
         
     def play_notification_sound(self):
         """
@@ -1088,57 +1384,45 @@ class PomodoroTimer:
         4. IMPORT HANDLING: Dealing with missing dependencies gracefully
         
         FALLBACK HIERARCHY:
-        1. Try pygame + numpy for high-quality generated sound
+        1. Play the generated pygame sound (built once, on first use)
         2. Fall back to system bell/beep sound
         3. Final fallback to console beep
         
         WHY MULTIPLE FALLBACKS:
-        - Some systems may not have pygame/numpy installed
+        - Some systems may not have pygame installed
         - Some systems may have audio restrictions
         - Ensures notification works in any environment
         """
         
         # ═══════════════════════════════════════════════════════════════
-        # ATTEMPT 1: HIGH-QUALITY GENERATED SOUND (PYGAME + NUMPY)
+        # ATTEMPT 1: HIGH-QUALITY GENERATED SOUND (PYGAME)
         # ═══════════════════════════════════════════════════════════════
         
         try:
-            # Try to import and use pygame with numpy for generated sound
-            import numpy as np
-            
-            # Audio parameters for pleasant notification sound
-            sample_rate = 22050     # CD-quality sample rate
-            duration = 0.5          # Half-second notification
-            frequency = 800         # Pleasant 800Hz tone
-            
-            # Calculate number of audio frames needed
-            frames = int(duration * sample_rate)
+            # Set up pygame and build the sound the first time we get here
+            self._init_sound()
             
-            # Generate sine wave audio data
-            arr = np.zeros(frames)
-            for i in range(frames):
-                arr[i] = np.sin(2 * np.pi * frequency * i / sample_rate)
+            # PYTHON LEARNING: "is not None" checks that building the sound succeeded
+            if self._notify_sound is not None:
+                self._notify_sound.play()
+                return  # Success! Exit method
             
-            # Convert to proper audio format and create stereo sound
-            arr = (arr * 32767).astype(np.int16)
-            sound = pygame.sndarray.make_sound(np.array([arr, arr]).T)
-            sound.play()
-            
-            return  # Success! Exit method
-            
-        except (ImportError, Exception):
-            # pygame/numpy not available or audio system failed
+        except (RuntimeError, OSError, MemoryError):
+            # pygame audio system failed (pygame.error is a RuntimeError)
             pass
             
         # ═══════════════════════════════════════════════════════════════
         # ATTEMPT 2: SYSTEM BELL/BEEP (CROSS-PLATFORM)
         # ═══════════════════════════════════════════════════════════════
         
+        # PYTHON LEARNING: Importing inside a method delays the cost until it's needed
+        # These are only used when pygame couldn't play the sound, so the app
+        # doesn't load them at start-up
+        import platform
+        import subprocess
+        
         try:
             # Try platform-specific system notification sounds
-            import subprocess
-            import platform
-            
             system = platform.system().lower()
             
             if system == "darwin":  # macOS
@@ -1153,7 +1437,8 @@ class PomodoroTimer:
                     subprocess.run(["paplay", "/usr/share/sounds/alsa/Front_Left.wav"], 
                                  check=False, capture_output=True, timeout=1)
                     return
-                except:
+                except (OSError, subprocess.SubprocessError):
+                    # paplay is missing or hung - try speaker-test instead
                     subprocess.run(["speaker-test", "-t", "sine", "-f", "800", "-l", "1"], 
                                  check=False, capture_output=True, timeout=1)
                     return
@@ -1164,8 +1449,8 @@ class PomodoroTimer:
                 winsound.Beep(800, 500)  # 800Hz for 500ms
                 return
                 
-        except (ImportError, Exception):
-            # System-specific methods failed
+        except (ImportError, OSError, RuntimeError, subprocess.SubprocessError):
+            # System-specific methods failed (winsound.Beep raises RuntimeError)
             pass
             
         # ═══════════════════════════════════════════════════════════════
@@ -1175,13 +1460,33 @@ class PomodoroTimer:
         try:
             # Universal fallback - console bell character
             # This should work on virtually any system
-            print("\a" * 3)  # Triple beep for more noticeable notification
+            sys.stdout.write("\a" * 3)  # Triple beep for more noticeable notification
+            sys.stdout.flush()
             
-        except Exception:
+        except (OSError, AttributeError):
             # Even console beep failed - silent notification
             # This should never happen, but just in case...
             pass
         
+    def _request_display_update(self):
+        """
+        Ask for a display refresh once tkinter has finished its current work.
+        
+        Purpose: root.after_idle() runs the refresh when the event loop is idle,
+        so all widget changes land in a single redraw. Several requests made
+        before then share the same refresh.
+        """
+        if not self._display_pending:
+            self._display_pending = True
+            self.root.after_idle(self._apply_pending_updates)
+            
+    def _apply_pending_updates(self):
+        """
+        Run the display refresh requested by _request_display_update().
+        """
+        self._display_pending = False
+        self.update_display()
+        
     def update_display(self):
         """
         🖥️ PYTHON LEARNING: String Formatting, Dictionaries, and Mathematical Operations
@@ -1202,7 +1507,7 @@ class PomodoroTimer:
         - Progress bar percentage
         
         CALLED FROM MULTIPLE PLACES:
-        - Every second during countdown (from background thread)
+        - Every second during countdown (from _tick)
         - When user resets timer
         - When sessions change
         - During initialization
@@ -1212,43 +1517,51 @@ class PomodoroTimer:
         # TIME FORMATTING - CONVERT SECONDS TO MINUTES:SECONDS
         # ═══════════════════════════════════════════════════════════════
         
-        # PYTHON LEARNING: Integer Division (//) and Modulo (%) operators
-        # Example: 150 seconds = 2 minutes and 30 seconds
-        # 150 // 60 = 2 (minutes)
-        # 150 % 60 = 30 (remaining seconds)
-        minutes = self.time_left // 60    # How many full minutes
-        seconds = self.time_left % 60     # Remaining seconds after removing full minutes
+        # A negative index would count from the END of the list ("99:59"), so never
+        # let the time go below zero
+        if self.time_left < 0:
+            self.time_left = 0
         
-        # PYTHON LEARNING: f-string formatting with zero-padding
-        # f"{minutes:02d}" means format as integer with at least 2 digits, pad with zeros
-        # Example: 5 becomes "05", 25 stays "25"
-        time_text = f"{minutes:02d}:{seconds:02d}"
+        # PYTHON LEARNING: List lookup by index
+        # TIME_STRINGS (built once at startup) already holds every "MM:SS" text
+        # Example: TIME_STRINGS[150] is "02:30"
+        if self.time_left < len(TIME_STRINGS):
+            time_text = TIME_STRINGS[self.time_left]
+        else:
+            # Sessions of 100 minutes or more (typed into a spinbox) are formatted directly
+            # PYTHON LEARNING: divmod(a, b) returns (a // b, a % b) in one call
+            # f"{minutes:02d}" means format as integer with at least 2 digits, pad with zeros
+            minutes, seconds = divmod(self.time_left, 60)    # Full minutes, leftover seconds
+            time_text = f"{minutes:02d}:{seconds:02d}"
         
-        # Update the timer display label
-        # PYTHON LEARNING: .config() method changes widget properties after creation
-        self.time_label.config(text=time_text)
+        # Update the timer display label, unless it already shows this text
+        # (the display is also refreshed on resets and session changes, not just ticks)
+        # PYTHON LEARNING: .set() on a StringVar updates every widget linked to it
+        if time_text != self._last_time_text:
+            self._time_var.set(time_text)
+            self._last_time_text = time_text
         
         # ═══════════════════════════════════════════════════════════════
         # SESSION LABEL COLOR CODING
         # ═══════════════════════════════════════════════════════════════
         
-        # PYTHON LEARNING: Dictionary for mapping values
-        # Dictionaries store key-value pairs for quick lookups
-        session_colors = {
-            "Work": "#e74c3c",           # Red for work sessions (focus/concentration)
-            "Short Break": "#f39c12",    # Orange for short breaks (brief rest)
-            "Long Break": "#9b59b6"      # Purple for long breaks (extended restoration)
-        }
-        
-        # Update session label with current session name and appropriate color
-        self.session_label.config(
-            text=f"{self.current_session}",                                    # Session name
-            fg=session_colors.get(self.current_session, "#ecf0f1")           # Color lookup with default
-        )
-        
-        # PYTHON LEARNING: .get() method with default value
-        # dict.get(key, default) returns the value for key, or default if key not found
-        # This prevents KeyError if somehow an unexpected session type exists
+        # The session only changes at session boundaries, so most ticks skip this
+        # PYTHON LEARNING: != compares values - only relabel when something changed
+        if self.current_session != self._displayed_session:
+            
+            # PYTHON LEARNING: Dictionary for mapping values
+            # SESSION_COLORS (defined on the class) maps session names to colors
+            # Update session label with current session name and appropriate color
+            self._session_var.set(self.current_session)                           # Session name
+            self._style.configure(
+                "Session.TLabel",
+                foreground=self.SESSION_COLORS.get(self.current_session, "#ecf0f1")  # Color lookup with default
+            )
+            self._displayed_session = self.current_session
+            
+            # PYTHON LEARNING: .get() method with default value
+            # dict.get(key, default) returns the value for key, or default if key not found
+            # This prevents KeyError if somehow an unexpected session type exists
         
         # ═══════════════════════════════════════════════════════════════
         # PROGRESS BAR UPDATE
@@ -1258,15 +1571,20 @@ class PomodoroTimer:
         # Always check denominator before dividing!
         if self.total_time > 0:
             
-            # PYTHON LEARNING: Percentage calculation
-            # progress = (completed_time / total_time) × 100
+            # PYTHON LEARNING: Percentage calculation with whole numbers
+            # progress = (completed_time × 100) // total_time
             # completed_time = total_time - time_left
-            progress = ((self.total_time - self.time_left) / self.total_time) * 100
+            progress = (self.total_time - self.time_left) * 100 // self.total_time
             
-            # Update progress bar value
-            # PYTHON LEARNING: Dictionary-style access to widget properties
-            # Some tkinter widgets use ['property'] instead of .config()
-            self.progress['value'] = progress
+            # Only touch the progress bar when the whole-number percent changed
+            # (a 25-minute session moves 1% every 15 seconds)
+            if progress != self._last_pct:
+                
+                # Update progress bar value
+                # PYTHON LEARNING: Dictionary-style access to widget properties
+                # Some tkinter widgets use ['property'] instead of .config()
+                self.progress['value'] = progress
+                self._last_pct = progress
             
     def calculate_responsive_values(self):
         """
@@ -1298,10 +1616,12 @@ class PomodoroTimer:
         # GET CURRENT WINDOW DIMENSIONS
         # ═══════════════════════════════════════════════════════════════
         
-        # PYTHON LEARNING: Widget information methods
-        # These methods return the current actual size of the window
-        current_width = self.root.winfo_width()      # Current width in pixels
-        current_height = self.root.winfo_height()    # Current height in pixels
+        # PYTHON LEARNING: Reusing values we already have
+        # on_window_resize() stores the size from each '<Configure>' event, so we read
+        # it here instead of asking tkinter with winfo_width()/winfo_height()
+        # Before the first event it is our "standard" size, so the first layout is correct
+        current_width = self._cur_w      # Current width in pixels
+        current_height = self._cur_h     # Current height in pixels
         
         # ═══════════════════════════════════════════════════════════════
         # CALCULATE SCALING FACTORS
@@ -1319,6 +1639,26 @@ class PomodoroTimer:
         width_scale = max(0.8, min(1.5, width_scale))
         height_scale = max(0.8, min(1.5, height_scale))
         
+        # ═══════════════════════════════════════════════════════════════
+        # CALCULATE BUTTON WIDTH
+        # ═══════════════════════════════════════════════════════════════
+        
+        # PYTHON LEARNING: Integer division (//) keeps everything as whole numbers
+        # Button width (in characters) scales with WIDTH, but never below 8
+        self.button_width = max(8, (10 * current_width) // self.base_width)
+        
+        # ═══════════════════════════════════════════════════════════════
+        # SKIP THE REST IF THE SCALES HAVEN'T CHANGED
+        # ═══════════════════════════════════════════════════════════════
+        
+        # Beyond the 0.8-1.5 limits every size gives the same clamped scales, and so
+        # the same fonts and spacings as last time - no need to work them out again
+        # (the button width above isn't clamped, so it is always recalculated)
+        scales = (width_scale, height_scale)
+        if scales == self._last_scales:
+            return
+        self._last_scales = scales
+        
         # ═══════════════════════════════════════════════════════════════
         # CALCULATE RESPONSIVE FONT SIZES
         # ═══════════════════════════════════════════════════════════════
@@ -1327,9 +1667,6 @@ class PomodoroTimer:
         # Formula: scaled_size = base_size × scale_factor
         # max(minimum, scaled_size) ensures fonts never get too small
         
-        # Title font scales with window width
-        self.title_font_size = max(16, int(24 * width_scale))
-        
         # Session label font scales with width
         self.session_font_size = max(12, int(16 * width_scale))
         
@@ -1347,7 +1684,6 @@ class PomodoroTimer:
         # PYTHON LEARNING: Spacing scales with HEIGHT to maintain proportions
         # Vertical spacing should grow when window gets taller
         
-        self.title_pady = max(10, int(15 * height_scale))        # Title spacing
         self.session_pady = max(5, int(8 * height_scale))        # Session label spacing
         self.timer_pady = max(15, int(20 * height_scale))        # Timer spacing
         self.progress_pady = max(8, int(10 * height_scale))      # Progress bar spacing
@@ -1377,115 +1713,177 @@ class PomodoroTimer:
         
         EVENT-DRIVEN PROGRAMMING:
         - User resizes window → System generates '<Configure>' event
-        - tkinter calls this method automatically → We check if it's the main window
-        - If yes → We recalculate sizes and update the interface
+        - tkinter calls this method automatically (only for the main window)
+        - We schedule _apply_resize() to recalculate sizes a moment later
         
-        WHY CHECK event.widget:
+        DEBOUNCING:
+        - A window drag produces a burst of '<Configure>' events
+        - Each new event cancels the previously scheduled update and schedules a new one
+        - So the layout is only recalculated once, 80ms after the last event
+        
+        WHY NO event.widget CHECK:
         - Many widgets can generate '<Configure>' events
         - We only care about main window resize events
-        - Child widgets resizing shouldn't trigger our calculations
+        - The "PomodoroRoot" binding tag (see __init__) is only on the main window,
+          so child widgets resizing never call this method in the first place
         """
         
         # ═══════════════════════════════════════════════════════════════
-        # EVENT FILTERING - ONLY RESPOND TO MAIN WINDOW RESIZE
+        # EVENT FILTERING - IGNORE MOVES
         # ═══════════════════════════════════════════════════════════════
         
         # PYTHON LEARNING: Event object properties
-        # event.widget tells us which widget generated the event
-        # We only want to respond when the main window (self.root) is resized
-        if event.widget == self.root:
-            
-            # ═══════════════════════════════════════════════════════════
-            # RESPONSIVE DESIGN UPDATE SEQUENCE
-            # ═══════════════════════════════════════════════════════════
-            
-            # PYTHON LEARNING: Method coordination
-            # Call methods in the right order to update interface
-            
-            # 1. Recalculate all responsive values based on new window size
-            self.calculate_responsive_values()
+        # event.width/event.height hold the window's new size
+        # Moving the window also sends '<Configure>' - ignore it if the size is unchanged
+        if event.width == self._cur_w and event.height == self._cur_h:
+            return
+        
+        # Remember the new size - the event already carries it, so
+        # calculate_responsive_values() doesn't need to ask tkinter again
+        self._cur_w, self._cur_h = event.width, event.height
+        
+        # ═══════════════════════════════════════════════════════════════
+        # DEBOUNCE - WAIT UNTIL THE RESIZING PAUSES
+        # ═══════════════════════════════════════════════════════════════
+        
+        # Cancel the update scheduled by the previous event (if any)...
+        if self._resize_job is not None:
+            self.root.after_cancel(self._resize_job)
             
-            # 2. Apply new values to existing widgets
-            self.update_widget_styling()
+        # ...and schedule a fresh one 80ms from now
+        self._resize_job = self.root.after(80, self._apply_resize)
+        
+    def on_window_unmap(self, event):
+        """
+        Note that the window was minimized, so later ticks can be spaced out.
+        """
+        self._hidden = True
             
+    def on_window_map(self, event):
+        """
+        Note that the window is visible again and bring the display up to date.
+        
+        Purpose: While minimized the countdown only woke every 5 seconds, so
+        run a tick right away - it reads the deadline and shows the exact time.
+        """
+        if self._hidden:
+            self._hidden = False
+            if self.state is TimerState.RUNNING:
+                self._cancel_tick()
+                self._tick()
+                
+    def _apply_resize(self):
+        """
+        Apply a (debounced) window resize to the interface.
+        
+        Purpose: Runs once after a burst of resize events has settled, then
+        recalculates the responsive values and applies them to the widgets.
+        """
+        
+        # The scheduled job is running now, so there is nothing left to cancel
+        self._resize_job = None
+        
+        # ═══════════════════════════════════════════════════════════
+        # RESPONSIVE DESIGN UPDATE SEQUENCE
+        # ═══════════════════════════════════════════════════════════
+        
+        # PYTHON LEARNING: Method coordination
+        # Call methods in the right order to update interface
+        
+        # 1. Recalculate all responsive values based on new window size
+        self.calculate_responsive_values()
+        
+        # 2. Skip the widget updates if none of the values we apply actually changed
+        # PYTHON LEARNING: Tuples compare element by element, so one == checks them all
+        key = (self.session_font_size, self.button_font_size,
+               self.progress_length, self.button_width)
+        if key == self._last_responsive:
+            return
+        
+        # 3. Apply new values to existing widgets (it compares against _last_responsive,
+        #    so only remember the new values once they have been applied)
+        self.update_widget_styling()
+        self._last_responsive = key
+        
     def update_widget_styling(self):
         """
-        🎨 PYTHON LEARNING: Error Handling and Widget Management
+        🎨 PYTHON LEARNING: Guard Clauses and Widget Management
         =======================================================
         
         This method applies calculated responsive values to existing widgets.
         It demonstrates important GUI programming concepts:
         
-        1. ERROR HANDLING: Gracefully handling widget access errors
+        1. GUARD CLAUSES: Returning early when there is nothing to do yet
         2. WIDGET CONFIGURATION: Updating multiple widget properties
-        3. EXCEPTION TYPES: Understanding AttributeError specifically
+        3. CHANGE DETECTION: Skipping values that are already applied
         4. INITIALIZATION TIMING: Handling cases where widgets don't exist yet
         
-        WHY ERROR HANDLING IS NEEDED:
+        WHY THE _widgets_ready GUARD IS NEEDED:
         - This method might be called before widgets are created
         - During initialization, calculate_responsive_values() might run
         - Before create_widgets() has finished creating all the widgets
-        - AttributeError occurs when trying to access non-existent widgets
+        - Checking a flag is clearer than catching AttributeError, which would
+          also hide genuine typos
         
         FONT UPDATE STRATEGY:
-        - Update all text widgets with new calculated font sizes
-        - Maintain font families and weights (Arial, bold)
-        - Keep timer font fixed at 48pt for readability
-        - Update progress bar length for responsive width
+        - Widgets share Font objects created in create_widgets()
+        - Resizing a Font object updates every widget that uses it
+        - Families and weights (Arial, bold) are part of each Font object
+        - Timer font stays fixed at 48pt for readability, so it is never resized
+        - Update progress bar length and control button width for responsive width
         """
         
         # ═══════════════════════════════════════════════════════════════
-        # ERROR HANDLING FOR WIDGET ACCESS
+        # WAIT UNTIL THE WIDGETS EXIST
         # ═══════════════════════════════════════════════════════════════
         
-        # PYTHON LEARNING: try/except for specific error types
-        # AttributeError occurs when trying to access attributes that don't exist
-        try:
+        # PYTHON LEARNING: Guard clause instead of try/except
+        # During initialization this method might run before create_widgets() has
+        # finished. A flag makes that case explicit, and a real typo still raises
+        # an AttributeError instead of being silently ignored
+        if not self._widgets_ready:
+            return
             
-            # ═══════════════════════════════════════════════════════════
-            # UPDATE TEXT WIDGET FONTS
-            # ═══════════════════════════════════════════════════════════
-            
-            # PYTHON LEARNING: Widget configuration with calculated values
-            # Each widget gets updated with its appropriate responsive font size
-            
-            # Update title with new responsive font size
-            self.title_label.config(font=("Arial", self.title_font_size, "bold"))
-            
-            # Update session label with new responsive font size  
-            self.session_label.config(font=("Arial", self.session_font_size))
-            
-            # PYTHON LEARNING: Fixed vs responsive values
-            # Timer font stays at 48pt - notice we use self.timer_font_size which is always 48
-            self.time_label.config(font=("Arial", self.timer_font_size, "bold"))
-            
-            # Update all button fonts with new responsive size
-            self.start_button.config(font=("Arial", self.button_font_size, "bold"))
-            self.pause_button.config(font=("Arial", self.button_font_size, "bold"))
-            self.reset_button.config(font=("Arial", self.button_font_size, "bold"))
+        # The values the widgets currently use - anything unchanged is skipped,
+        # since every .configure()/.config() call is a trip into tkinter
+        # PYTHON LEARNING: Tuple unpacking assigns each item to its own name
+        old_session_size, old_button_size, old_length, old_width = self._last_responsive
+        
+        # ═══════════════════════════════════════════════════════════════
+        # UPDATE TEXT WIDGET FONTS
+        # ═══════════════════════════════════════════════════════════════
+        
+        # PYTHON LEARNING: Updating shared Font objects
+        # Each Font object is used by one or more widgets, so one .configure()
+        # call resizes all of them at once
+        
+        # Update session label with new responsive font size
+        if self.session_font_size != old_session_size:
+            self._session_font.configure(size=self.session_font_size)
+        
+        if self.button_font_size != old_button_size:
+            # Update the Start/Pause/Reset buttons (bold) with new responsive size
+            self._button_bold_font.configure(size=self.button_font_size)
             
             # Update settings button (no bold weight for this one)
-            self.settings_button.config(font=("Arial", self.button_font_size))
-            
-            # ═══════════════════════════════════════════════════════════
-            # UPDATE PROGRESS BAR LENGTH
-            # ═══════════════════════════════════════════════════════════
-            
-            # PYTHON LEARNING: Different widget configuration styles
-            # Some widgets use .config(), others use dictionary-style access
-            self.progress.config(length=self.progress_length)
-            
+            self._button_font.configure(size=self.button_font_size)
+        
+        # PYTHON LEARNING: Fixed vs responsive values
+        # The timer font stays at 48pt, so self._timer_font is never resized
+        
         # ═══════════════════════════════════════════════════════════════
-        # HANDLE INITIALIZATION TIMING ISSUES
+        # UPDATE PROGRESS BAR LENGTH
         # ═══════════════════════════════════════════════════════════════
         
-        # PYTHON LEARNING: Specific exception handling
-        # AttributeError means we tried to access an attribute that doesn't exist
-        except AttributeError:
-            # This happens when widgets haven't been created yet
-            # During initialization, this method might run before create_widgets()
-            # PYTHON LEARNING: pass statement does nothing - silently ignore the error
-            pass
+        # PYTHON LEARNING: Different widget configuration styles
+        # Some widgets use .config(), others use dictionary-style access
+        if self.progress_length != old_length:
+            self.progress.config(length=self.progress_length)
+        
+        # Start/Pause/Reset button width (in characters) follows the window width
+        if self.button_width != old_width:
+            for button in self._bold_buttons:
+                button.config(width=self.button_width)
 
     def force_button_colors(self):
         """